@@ -8,20 +8,23 @@ Press 'w' to delete all screenshots.
 Press 's' to toggle monitoring on/off.
 """
 
+import io
 import os
+import shlex
+import socket
 import sys
-import time
 import hashlib
-import tempfile
 import getpass
-import gc
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 from dataclasses import dataclass
 from PIL import Image, ImageGrab
+import keyring
 import paramiko
 from plyer import notification
 import pyperclip
@@ -34,10 +37,15 @@ REMOTE_USER = "username"  # Your SSH username
 REMOTE_PATH = "/path/to/screenshots/"  # Remote directory for screenshots
 SSH_KEY_PATH = Path.home() / ".ssh" / "id_rsa"  # Path to your SSH private key
 KNOWN_HOSTS_PATH = Path.home() / ".ssh" / "known_hosts"  # SSH known hosts file
+KEYRING_SERVICE = "screen2scp"  # OS keyring entry for the key passphrase
 HASH_TRACKING_FILE = Path(__file__).parent / "uploaded_hashes.txt"
+HASH_TOMBSTONE_FILE = Path(__file__).parent / "uploaded_hashes.removed.txt"
+HASH_COMPACT_THRESHOLD = 256  # rewrite tracking file once this many tombstones pile up
 JPEG_QUALITY = 85
 CHECK_INTERVAL = 0.5  # seconds
 THUMBNAIL_SIZE = (128, 128)  # Larger thumbnails
+JPEG_CACHE_RECORDS = 20  # keep raw JPEG bytes in memory for this many recent uploads
+SFTP_POOL_SIZE = 4  # max SFTP channels opened (lazily) for concurrent deletes
 
 
 @dataclass
@@ -48,7 +56,8 @@ class ScreenshotRecord:
     size: str
     remote_path: str
     image_hash: str
-    thumbnail: Optional[Image.Image] = None
+    thumbnail_ppm: Optional[bytes] = None  # PPM-encoded, ready for tk.PhotoImage
+    local_bytes: Optional[bytes] = None  # uploaded JPEG, kept for recent records
 
 
 class SecureSCPUploader:
@@ -57,38 +66,140 @@ class SecureSCPUploader:
     def __init__(self, gui_queue: queue.Queue):
         self.ssh_client: Optional[paramiko.SSHClient] = None
         self.sftp_client = None
+        # Delete channels are opened lazily, up to SFTP_POOL_SIZE, and
+        # recycled through this queue - multi-session sharing on the one
+        # authenticated transport without paying for unused channels
+        self._sftp_pool: queue.Queue = queue.Queue()
+        self._sftp_pool_lock = threading.Lock()
+        self._sftp_pool_opened = 0
         self.last_image_hash: Optional[str] = None
         self.uploaded_hashes: set = set()
         self._running = False
+        self._stopped = False
+        self._disconnected = False
+        self._wake = threading.Event()  # pokes the polling loop awake
+        self._clipboard_lock = threading.Lock()
         self._monitoring = True  # Toggle for monitoring
         self._copy_path_to_clipboard = True  # Toggle for auto-copying path
         self.gui_queue = gui_queue
-        self.upload_history: List[ScreenshotRecord] = []
+        # Insertion-ordered and filename-keyed: removal is an O(1) pop and
+        # the newest record is the last entry. The lock covers the window
+        # between snapshotting and mutating from GUI vs worker threads.
+        self.upload_history: Dict[str, ScreenshotRecord] = {}
+        self._history_lock = threading.Lock()
+        self._hash_file_mtime: Optional[int] = None
+        self._tombstoned_hashes: set = set()
+        self._last_quick_sig: Optional[bytes] = None
+        self._listener_thread_id: Optional[int] = None
+        # Uploads run on a small pool so queued screenshots overlap their
+        # network round trips on separate channels of the one transport
+        self._upload_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='upload')
+        # Toasts go through a dedicated thread; the platform backends can
+        # block for tens to hundreds of ms
+        self._notify_queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self._notify_worker, daemon=True).start()
         
     def load_uploaded_hashes(self):
-        """Load set of already uploaded image hashes."""
-        if HASH_TRACKING_FILE.exists():
-            with open(HASH_TRACKING_FILE, 'r') as f:
-                self.uploaded_hashes = set(line.strip() for line in f if line.strip())
-    
+        """Load set of already uploaded image hashes, applying any tombstones."""
+        if not HASH_TRACKING_FILE.exists():
+            return
+        mtime = HASH_TRACKING_FILE.stat().st_mtime_ns
+        if mtime == self._hash_file_mtime:
+            return
+        self._hash_file_mtime = mtime
+        with open(HASH_TRACKING_FILE, 'r') as f:
+            self.uploaded_hashes = set(line.strip() for line in f if line.strip())
+        if HASH_TOMBSTONE_FILE.exists():
+            with open(HASH_TOMBSTONE_FILE, 'r') as f:
+                self._tombstoned_hashes = set(line.strip() for line in f if line.strip())
+            self.uploaded_hashes -= self._tombstoned_hashes
+            if len(self._tombstoned_hashes) > HASH_COMPACT_THRESHOLD:
+                self.compact_hash_files()
+
     def save_uploaded_hash(self, image_hash: str):
         """Save hash of uploaded image to tracking file."""
         self.uploaded_hashes.add(image_hash)
+        if image_hash in self._tombstoned_hashes:
+            # Re-upload of a previously deleted image: scrub its tombstone
+            # so it doesn't shadow this entry on the next startup
+            self._tombstoned_hashes.discard(image_hash)
+            self.write_hash_file(HASH_TOMBSTONE_FILE, self._tombstoned_hashes)
         with open(HASH_TRACKING_FILE, 'a') as f:
             f.write(f"{image_hash}\n")
+
+    def discard_uploaded_hash(self, image_hash: str):
+        """Drop a hash from the dedupe set via an appended tombstone.
+
+        Appending one line beats rewriting the whole tracking file on
+        every deletion; compaction folds the tombstones back in later.
+        """
+        self.uploaded_hashes.discard(image_hash)
+        self._tombstoned_hashes.add(image_hash)
+        with open(HASH_TOMBSTONE_FILE, 'a') as f:
+            f.write(f"{image_hash}\n")
+
+    def write_hash_file(self, path: Path, hashes: set):
+        """Rewrite a hash file atomically: one write, then os.replace.
+
+        A crash mid-rewrite leaves the old file intact instead of a
+        truncated one, and the single joined write beats a Python-level
+        loop of per-line writes on large sets.
+        """
+        tmp = path.with_suffix('.tmp')
+        with open(tmp, 'w') as f:
+            f.write(''.join(f"{h}\n" for h in hashes))
+        os.replace(tmp, path)
+
+    def compact_hash_files(self):
+        """Fold tombstones into the tracking file and clear them."""
+        self.write_hash_file(HASH_TRACKING_FILE, self.uploaded_hashes)
+        self._tombstoned_hashes = set()
+        if HASH_TOMBSTONE_FILE.exists():
+            HASH_TOMBSTONE_FILE.unlink()
     
     def calculate_image_hash(self, image: Image.Image) -> str:
-        """Calculate MD5 hash of image for duplicate detection."""
-        import io
-        buffer = io.BytesIO()
-        image.save(buffer, format='PNG')
-        return hashlib.md5(buffer.getvalue()).hexdigest()
+        """Calculate BLAKE2b hash of raw pixel data for duplicate detection."""
+        # Hashing the pixel buffer directly skips a full PNG encode; the
+        # mode/size prefix avoids cross-mode collisions
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f'{image.mode}{image.size}'.encode())
+        h.update(image.tobytes())
+        return h.hexdigest()
     
-    def create_thumbnail(self, image: Image.Image) -> Image.Image:
-        """Create a thumbnail from the image."""
-        thumb = image.copy()
-        thumb.thumbnail(THUMBNAIL_SIZE)
-        return thumb
+    def calculate_quick_signature(self, image: Image.Image) -> bytes:
+        """Cheap 16x16 grayscale signature for unchanged-clipboard checks."""
+        # Mode and size are prepended so differently shaped captures can
+        # never alias, only same-size near-identical ones
+        return (f'{image.mode}{image.size}'.encode()
+                + image.resize((16, 16), Image.BILINEAR).convert('L').tobytes())
+
+    def flatten_alpha(self, image: Image.Image) -> Image.Image:
+        """Blend an RGBA/LA image onto a white background in one pass."""
+        # getchannel('A') pulls just the alpha plane; the old split()
+        # materialized every channel as a separate image first
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        return background
+
+    def create_thumbnail_ppm(self, image: Image.Image) -> bytes:
+        """Create a PPM-encoded thumbnail ready for tk.PhotoImage.
+
+        Encoding on the worker thread means the Tk mainloop only does a
+        single bulk image load instead of marshaling pixels through
+        ImageTk row by row.
+        """
+        if image.width * image.height > 2_000_000:
+            # Integer 4x4 box reduce first - a vectorized pass that shrinks
+            # the work the resampler below has to do by 16x
+            thumb = image.reduce(4)
+        else:
+            thumb = image.copy()
+        # BOX is 10-20x cheaper than the default LANCZOS and looks the
+        # same at 128px; reducing_gap caps the resample input size
+        thumb.thumbnail(THUMBNAIL_SIZE, resample=Image.BOX, reducing_gap=2.0)
+        thumb = thumb.convert('RGB')
+        return b'P6\n%d %d\n255\n' % thumb.size + thumb.tobytes()
     
     def connect_ssh(self, passphrase: str):
         """Establish SSH connection with password-protected key."""
@@ -100,6 +211,17 @@ class SecureSCPUploader:
         self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         
         try:
+            # Pre-tune the TCP socket paramiko will ride on: disable Nagle
+            # and enlarge the kernel buffers so the TCP window can grow to
+            # the bandwidth-delay product on high-latency links
+            family, socktype, proto, _, addr = socket.getaddrinfo(
+                REMOTE_HOST, 22, socket.AF_UNSPEC, socket.SOCK_STREAM)[0]
+            sock = socket.socket(family, socktype, proto)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 * 1024 * 1024)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 32 * 1024 * 1024)
+            sock.connect(addr)
+
             # Connect with private key and passphrase
             self.ssh_client.connect(
                 hostname=REMOTE_HOST,
@@ -107,17 +229,26 @@ class SecureSCPUploader:
                 key_filename=str(SSH_KEY_PATH),
                 passphrase=passphrase,
                 look_for_keys=False,
-                allow_agent=False
+                allow_agent=False,
+                sock=sock
             )
-            
+
+            # Widen the SSH flow-control window so many requests can stay in
+            # flight on high-latency links (the 64KB default stalls transfers)
+            transport = self.ssh_client.get_transport()
+            transport.default_window_size = 134217727
+            transport.default_max_packet_size = 2 ** 19
+            transport.packetizer.REKEY_BYTES = pow(2, 40)
+            transport.packetizer.REKEY_PACKETS = pow(2, 40)
+
             # Open SFTP session
             self.sftp_client = self.ssh_client.open_sftp()
             
-            # Ensure remote directory exists
-            try:
-                self.sftp_client.stat(REMOTE_PATH)
-            except FileNotFoundError:
-                self.ssh_client.exec_command(f"mkdir -p {REMOTE_PATH}")
+            # Ensure remote directory exists - one idempotent round trip
+            # instead of a stat-then-mkdir pair
+            _, stdout, _ = self.ssh_client.exec_command(
+                f"mkdir -p {shlex.quote(REMOTE_PATH)}")
+            stdout.channel.recv_exit_status()
             
             # Save host key for future verification
             if not KNOWN_HOSTS_PATH.exists():
@@ -128,12 +259,49 @@ class SecureSCPUploader:
             raise Exception(f"Connection failed: {e}")
     
     def disconnect(self):
-        """Close SSH connection and cleanup."""
+        """Close SSH connection and cleanup. Safe to call twice."""
+        if self._disconnected:
+            return
+        self._disconnected = True
+        # Let in-flight uploads drain before tearing down their transport
+        self._upload_executor.shutdown(wait=True)
+        while not self._sftp_pool.empty():
+            self._sftp_pool.get().close()
         if self.sftp_client:
             self.sftp_client.close()
         if self.ssh_client:
             self.ssh_client.close()
     
+    def acquire_sftp(self):
+        """Borrow a delete channel, opening one lazily up to the cap."""
+        try:
+            return self._sftp_pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._sftp_pool_lock:
+            open_new = self._sftp_pool_opened < SFTP_POOL_SIZE
+            if open_new:
+                self._sftp_pool_opened += 1
+        if open_new:
+            try:
+                return self.ssh_client.get_transport().open_sftp_client()
+            except Exception:
+                with self._sftp_pool_lock:
+                    self._sftp_pool_opened -= 1
+                raise
+        # Cap reached: wait for a channel to come back
+        return self._sftp_pool.get()
+
+    def release_sftp(self, sftp):
+        """Return a borrowed delete channel to the pool."""
+        self._sftp_pool.put(sftp)
+
+    def fetch_remote_bytes(self, remote_path: str) -> bytes:
+        """Read a remote file straight into memory over SFTP."""
+        buf = io.BytesIO()
+        self.sftp_client.getfo(remote_path, buf)
+        return buf.getvalue()
+
     def get_clipboard_image(self) -> Optional[Image.Image]:
         """Get image from clipboard if available."""
         try:
@@ -144,67 +312,68 @@ class SecureSCPUploader:
             pass
         return None
     
-    def upload_screenshot(self, image: Image.Image) -> Optional[ScreenshotRecord]:
+    def upload_screenshot(self, image: Image.Image, image_hash: str) -> Optional[ScreenshotRecord]:
         """Upload screenshot via SCP with atomic temp file approach."""
         try:
             # Generate filename with timestamp
             timestamp = datetime.now()
-            filename = f"screenshot_{timestamp.strftime('%Y%m%d_%H%M%S')}.jpg"
+            # Millisecond suffix keeps concurrent uploads from racing to
+            # the same remote filename
+            filename = (f"screenshot_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+                        f"_{timestamp.microsecond // 1000:03d}.jpg")
             temp_filename = f"{filename}.tmp"
             
             remote_temp_path = f"{REMOTE_PATH}{temp_filename}"
             remote_final_path = f"{REMOTE_PATH}{filename}"
             
-            # Create thumbnail before conversion
-            thumbnail = self.create_thumbnail(image)
-            
-            # Convert to JPEG and save to local temp file
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-                local_temp_path = tmp_file.name
-            
-            try:
-                # Convert RGBA to RGB if necessary
-                if image.mode in ('RGBA', 'LA'):
-                    background = Image.new('RGB', image.size, (255, 255, 255))
-                    background.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                    image = background
-                elif image.mode != 'RGB':
-                    image = image.convert('RGB')
-                
-                # Save as JPEG
-                image.save(local_temp_path, 'JPEG', quality=JPEG_QUALITY, optimize=True)
-                
-                # Get file size
-                size_bytes = os.path.getsize(local_temp_path)
-                size_str = f"{size_bytes / 1024:.1f} KB"
-                
-                # Upload to temp location
-                self.sftp_client.put(local_temp_path, remote_temp_path)
-                
-                # Atomic rename on server
-                self.sftp_client.rename(remote_temp_path, remote_final_path)
-                
-                # Copy full path to clipboard (if enabled)
-                if self._copy_path_to_clipboard:
-                    pyperclip.copy(remote_final_path)
-                
-                # Create record
-                record = ScreenshotRecord(
-                    filename=filename,
-                    timestamp=timestamp,
-                    size=size_str,
-                    remote_path=remote_final_path,
-                    image_hash=self.calculate_image_hash(image),
-                    thumbnail=thumbnail
-                )
-                
-                return record
-                
-            finally:
-                # Cleanup local temp file
-                if os.path.exists(local_temp_path):
-                    os.unlink(local_temp_path)
-                    
+            # Convert RGBA to RGB if necessary
+            if image.mode in ('RGBA', 'LA'):
+                image = self.flatten_alpha(image)
+            elif image.mode != 'RGB':
+                image = image.convert('RGB')
+
+            # Thumbnail from the flattened image, encoded off the Tk thread
+            thumbnail_ppm = self.create_thumbnail_ppm(image)
+
+            # Encode JPEG in memory - no local temp file needed. optimize
+            # would run a second Huffman pass (~2x encode time) for a
+            # marginal size gain; fixed 4:2:0 subsampling keeps the encoder
+            # on its fast path
+            buf = io.BytesIO()
+            image.save(buf, 'JPEG', quality=JPEG_QUALITY, optimize=False, subsampling=2)
+            jpeg_bytes = buf.getvalue()
+            size_str = f"{len(jpeg_bytes) / 1024:.1f} KB"
+
+            # Stream the bytes through one remote command: a single long
+            # write with the atomic rename done server-side, instead of
+            # SFTP's per-chunk request/response round trips
+            command = (
+                f"umask 022 && cat > {shlex.quote(remote_temp_path)} && "
+                f"mv {shlex.quote(remote_temp_path)} {shlex.quote(remote_final_path)}"
+            )
+            stdin, stdout, _ = self.ssh_client.exec_command(command)
+            stdin.write(jpeg_bytes)
+            stdin.channel.shutdown_write()
+            if stdout.channel.recv_exit_status() != 0:
+                raise IOError(f"Remote write failed for {filename}")
+
+            # Copy full path to clipboard (if enabled)
+            if self._copy_path_to_clipboard:
+                pyperclip.copy(remote_final_path)
+
+            # Create record
+            record = ScreenshotRecord(
+                filename=filename,
+                timestamp=timestamp,
+                size=size_str,
+                remote_path=remote_final_path,
+                image_hash=image_hash,
+                thumbnail_ppm=thumbnail_ppm,
+                local_bytes=jpeg_bytes
+            )
+
+            return record
+
         except Exception as e:
             print(f"Upload failed: {e}")
             return None
@@ -212,54 +381,128 @@ class SecureSCPUploader:
     def delete_screenshot(self, record: ScreenshotRecord) -> bool:
         """Delete a screenshot from the remote server."""
         try:
-            self.sftp_client.remove(record.remote_path)
+            # Borrow a channel from the pool so concurrent deletes don't
+            # serialize on one SFTP session
+            sftp = self.acquire_sftp()
+            try:
+                if sftp.get_channel().closed:
+                    # The channel died (idle timeout, server hiccup);
+                    # replace it on the same authenticated transport
+                    sftp = self.ssh_client.get_transport().open_sftp_client()
+                try:
+                    sftp.remove(record.remote_path)
+                except FileNotFoundError:
+                    # Already gone (e.g. a partially applied batch rm) -
+                    # the goal state is reached, carry on to the cleanup
+                    pass
+            finally:
+                self.release_sftp(sftp)
             # Remove from tracking
             if record.image_hash in self.uploaded_hashes:
-                self.uploaded_hashes.discard(record.image_hash)
-                # Update tracking file
-                with open(HASH_TRACKING_FILE, 'w') as f:
-                    for h in self.uploaded_hashes:
-                        f.write(f"{h}\n")
+                self.discard_uploaded_hash(record.image_hash)
             return True
         except Exception as e:
             print(f"Delete failed: {e}")
             return False
     
-    def notify(self, title: str, message: str, success: bool = True):
-        """Show Windows notification."""
+    def delete_many(self, records: List[ScreenshotRecord]) -> bool:
+        """Delete many screenshots in a single remote rm round trip.
+
+        Returns True when the whole batch succeeded; callers fall back
+        to per-record deletes otherwise.
+        """
+        if not records:
+            return True
         try:
-            notification.notify(
-                title=title,
-                message=message,
-                app_name="Screenshot SCP Uploader",
-                timeout=3
-            )
-        except Exception:
-            pass
+            paths = shlex.join(record.remote_path for record in records)
+            _, stdout, _ = self.ssh_client.exec_command(f"rm -f -- {paths}")
+            if stdout.channel.recv_exit_status() != 0:
+                return False
+        except Exception as e:
+            print(f"Batch delete failed: {e}")
+            return False
+        for record in records:
+            if record.image_hash in self.uploaded_hashes:
+                self.discard_uploaded_hash(record.image_hash)
+        return True
+
+    def notify(self, title: str, message: str, success: bool = True):
+        """Queue a desktop notification; shown from the notify thread."""
+        self._notify_queue.put((title, message))
+
+    def _notify_worker(self):
+        """Drain queued notifications without blocking the callers."""
+        while True:
+            title, message = self._notify_queue.get()
+            try:
+                notification.notify(
+                    title=title,
+                    message=message,
+                    app_name="Screenshot SCP Uploader",
+                    timeout=3
+                )
+            except Exception:
+                pass
     
     def process_clipboard(self):
         """Check clipboard and process any new screenshot."""
         if not self._monitoring:
             return
-            
-        image = self.get_clipboard_image()
-        if not image:
-            return
-        
-        # Calculate hash
-        image_hash = self.calculate_image_hash(image)
-        
-        # Skip if same as last processed or already uploaded
-        if image_hash == self.last_image_hash or image_hash in self.uploaded_hashes:
-            return
-        
-        self.last_image_hash = image_hash
-        
-        # Upload
-        record = self.upload_screenshot(image)
+
+        # Serialized so an explicit recheck (resume) can't race the
+        # monitor thread into double-submitting the same image
+        with self._clipboard_lock:
+            image = self.get_clipboard_image()
+            if not image:
+                return
+
+            # Cheap signature first: an unchanged clipboard (the common
+            # case between polls) is caught by 256 bytes of comparison
+            # instead of hashing the full-resolution pixel buffer
+            quick_sig = self.calculate_quick_signature(image)
+            if quick_sig == self._last_quick_sig:
+                return
+            self._last_quick_sig = quick_sig
+
+            # Calculate hash
+            image_hash = self.calculate_image_hash(image)
+
+            # Skip if same as last processed or already uploaded
+            if image_hash == self.last_image_hash or image_hash in self.uploaded_hashes:
+                return
+
+            self.last_image_hash = image_hash
+            # Reserve the hash up front so the same image can't be
+            # submitted again while its upload is still in flight
+            self.uploaded_hashes.add(image_hash)
+
+            # Hand off to the pool; the monitor thread goes straight back
+            # to watching the clipboard while the upload's RTTs play out
+            self._upload_executor.submit(self._upload_worker, image, image_hash)
+
+    def request_recheck(self):
+        """Re-examine the clipboard immediately (used when resuming).
+
+        On Windows the listener is event-driven: a WM_CLIPBOARDUPDATE
+        that fired while monitoring was paused was consumed and won't be
+        re-delivered, so check inline. Elsewhere, poke the poll loop.
+        """
+        if sys.platform == 'win32':
+            self.process_clipboard()
+        else:
+            self._wake.set()
+
+    def _upload_worker(self, image: Image.Image, image_hash: str):
+        """Run one upload on the pool and report the result to the GUI."""
+        record = self.upload_screenshot(image, image_hash)
         if record:
             self.save_uploaded_hash(image_hash)
-            self.upload_history.insert(0, record)  # Add to beginning
+            with self._history_lock:
+                self.upload_history[record.filename] = record
+                # Cap how many raw JPEGs stay resident (newest are last)
+                records = list(self.upload_history.values())
+                for old_record in records[:-JPEG_CACHE_RECORDS]:
+                    old_record.local_bytes = None
             # Notify GUI
             self.gui_queue.put(('uploaded', record))
             self.notify(
@@ -268,33 +511,128 @@ class SecureSCPUploader:
                 success=True
             )
         else:
+            # Release the reservation so a retry paste can go through
+            self.uploaded_hashes.discard(image_hash)
             self.gui_queue.put(('error', "Upload failed"))
             self.notify(
                 "Upload Failed",
                 "Could not upload screenshot",
                 success=False
             )
-        
-        # Clear image from memory
-        del image
-        gc.collect()
     
     def run(self):
         """Main loop - monitor clipboard and upload screenshots."""
         self._running = True
-        
+
         try:
-            while self._running:
-                self.process_clipboard()
-                time.sleep(CHECK_INTERVAL)
+            if sys.platform == 'win32':
+                self._run_clipboard_listener()
+            else:
+                self._run_polling()
         except Exception as e:
             self.gui_queue.put(('error', str(e)))
         finally:
             self._running = False
-    
+
+    def _run_polling(self):
+        """Poll the clipboard on a fixed interval (non-Windows fallback).
+
+        Waiting on an event instead of sleeping means stop() and UI pokes
+        take effect immediately rather than after up to a full interval.
+        """
+        while self._running:
+            self.process_clipboard()
+            self._wake.wait(CHECK_INTERVAL)
+            self._wake.clear()
+
+    def _run_clipboard_listener(self):
+        """Sleep until Windows reports a clipboard change.
+
+        A message-only window registered with AddClipboardFormatListener
+        receives WM_CLIPBOARDUPDATE, so the thread does no work at all
+        between changes instead of waking twice a second to re-read an
+        unchanged clipboard.
+        """
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        # ctypes defaults return types to c_int, which truncates 64-bit
+        # handles and LRESULTs on Win64
+        kernel32.GetModuleHandleW.restype = wintypes.HINSTANCE
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.DefWindowProcW.restype = wintypes.LPARAM
+        user32.DefWindowProcW.argtypes = [
+            wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        WM_CLIPBOARDUPDATE = 0x031D
+        HWND_MESSAGE = -3
+
+        WNDPROC = ctypes.WINFUNCTYPE(
+            wintypes.LPARAM, wintypes.HWND, wintypes.UINT,
+            wintypes.WPARAM, wintypes.LPARAM
+        )
+
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == WM_CLIPBOARDUPDATE:
+                self.process_clipboard()
+                return 0
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        class WNDCLASS(ctypes.Structure):
+            _fields_ = [
+                ("style", wintypes.UINT),
+                ("lpfnWndProc", WNDPROC),
+                ("cbClsExtra", ctypes.c_int),
+                ("cbWndExtra", ctypes.c_int),
+                ("hInstance", wintypes.HINSTANCE),
+                ("hIcon", wintypes.HICON),
+                ("hCursor", wintypes.HANDLE),
+                ("hbrBackground", wintypes.HBRUSH),
+                ("lpszMenuName", wintypes.LPCWSTR),
+                ("lpszClassName", wintypes.LPCWSTR),
+            ]
+
+        # Keep a reference to the callback so ctypes doesn't free it
+        wndproc_ref = WNDPROC(wnd_proc)
+        wc = WNDCLASS()
+        wc.lpfnWndProc = wndproc_ref
+        wc.hInstance = kernel32.GetModuleHandleW(None)
+        wc.lpszClassName = "Screen2ScpClipboardListener"
+        user32.RegisterClassW(ctypes.byref(wc))
+
+        hwnd = user32.CreateWindowExW(
+            0, wc.lpszClassName, None, 0, 0, 0, 0, 0,
+            HWND_MESSAGE, None, wc.hInstance, None
+        )
+        user32.AddClipboardFormatListener(hwnd)
+        self._listener_thread_id = kernel32.GetCurrentThreadId()
+
+        try:
+            # Catch anything already on the clipboard at startup
+            self.process_clipboard()
+
+            msg = wintypes.MSG()
+            while self._running and user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            user32.RemoveClipboardFormatListener(hwnd)
+            user32.DestroyWindow(hwnd)
+            self._listener_thread_id = None
+
     def stop(self):
-        """Stop the monitoring loop."""
+        """Stop the monitoring loop. Safe to call twice."""
+        if self._stopped:
+            return
+        self._stopped = True
         self._running = False
+        self._wake.set()
+        if self._listener_thread_id is not None and sys.platform == 'win32':
+            import ctypes
+            WM_QUIT = 0x0012
+            ctypes.windll.user32.PostThreadMessageW(
+                self._listener_thread_id, WM_QUIT, 0, 0)
     
     def toggle_monitoring(self):
         """Toggle clipboard monitoring on/off."""
@@ -316,10 +654,24 @@ class ScreenshotUploaderGUI:
         self.style = ttk.Style()
         self.style.configure("Title.TLabel", font=("Helvetica", 16, "bold"))
         self.style.configure("Status.TLabel", font=("Helvetica", 10))
+        # Register the delete-flash style up front: the first configure
+        # against it becomes a hash lookup on an already-built element
+        # chain (it was previously never defined at all)
+        self.style.configure("Red.TFrame", background="#ffcccc")
         
         # Thumbnail cache
         self.thumbnail_cache = {}
         self.items_to_delete = []
+        # Row widgets keyed by filename for O(1) lookup on delete
+        self._row_widgets = {}
+        self._row_separators = {}
+        # Pending status-revert timer, canceled before each new status
+        self._status_after = None
+        # True while a bulk delete is in flight; skips the per-row
+        # animation/stats work and blocks overlapping delete actions
+        self._bulk_deleting = False
+        # Last rendered stats count; lets _update_stats skip no-op configures
+        self._last_stats_count = -1
         
         self.setup_ui()
         
@@ -411,14 +763,7 @@ class ScreenshotUploaderGUI:
         # Canvas for scrolling
         self.canvas = tk.Canvas(list_frame, highlightthickness=0)
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw", width=960)
+        self._create_scrollable_frame()
         self.canvas.configure(yscrollcommand=scrollbar.set)
         
         self.canvas.grid(row=0, column=0, sticky="nsew")
@@ -482,6 +827,45 @@ class ScreenshotUploaderGUI:
         )
         self.quit_btn.pack(side=tk.RIGHT)
     
+    def _update_stats(self, count: int):
+        """Render the uploaded-count line, skipping no-op Tcl configures."""
+        if count == self._last_stats_count:
+            return
+        self._last_stats_count = count
+        self.stats_label.config(
+            text=f"Uploaded: {count} screenshot{'s' if count != 1 else ''}")
+
+    def _set_status(self, text: str, foreground: str, revert_ms: Optional[int] = None):
+        """Update the status line, debouncing any pending revert timer.
+
+        Rapid actions used to stack one revert callback per status
+        change; canceling the previous timer keeps it at one.
+        """
+        if self._status_after is not None:
+            self.root.after_cancel(self._status_after)
+            self._status_after = None
+        self.status_label.config(text=text, foreground=foreground)
+        if revert_ms is not None:
+            self._status_after = self.root.after(revert_ms, self._revert_status)
+
+    def _revert_status(self):
+        """Return the status line to its idle text."""
+        self._status_after = None
+        self.status_label.config(text="Monitoring clipboard...", foreground="gray")
+
+    def _create_scrollable_frame(self):
+        """(Re)create the rows container inside the canvas."""
+        # The container is the canvas's only item; drop any dead window
+        # item left from a previous container before adding the new one
+        self.canvas.delete("all")
+        self.scrollable_frame = ttk.Frame(self.canvas)
+        self.scrollable_frame.bind("<Configure>", self._on_frame_configure)
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw", width=960)
+
+    def _on_frame_configure(self, event):
+        """Keep the canvas scrollregion in sync with the rows container."""
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
         self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -507,6 +891,9 @@ class ScreenshotUploaderGUI:
         """Toggle monitoring on/off."""
         is_monitoring = self.uploader.toggle_monitoring()
         if is_monitoring:
+            # Re-check right away: a clipboard change during the pause
+            # won't announce itself again
+            self.uploader.request_recheck()
             self.monitoring_label.config(text="[ON]", foreground="green")
             self.status_label.config(text="Monitoring clipboard...", foreground="gray")
         else:
@@ -518,14 +905,10 @@ class ScreenshotUploaderGUI:
         self.uploader._copy_path_to_clipboard = not self.uploader._copy_path_to_clipboard
         if self.uploader._copy_path_to_clipboard:
             self.autocopy_label.config(text="| AutoCopy: ON", foreground="green")
-            self.status_label.config(text="Auto-copy enabled", foreground="green")
+            self._set_status("Auto-copy enabled", "green", revert_ms=2000)
         else:
             self.autocopy_label.config(text="| AutoCopy: OFF", foreground="red")
-            self.status_label.config(text="Auto-copy disabled", foreground="orange")
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Monitoring clipboard...",
-            foreground="gray"
-        ))
+            self._set_status("Auto-copy disabled", "orange", revert_ms=2000)
 
     def check_queue(self):
         """Check for messages from the uploader thread."""
@@ -543,23 +926,28 @@ class ScreenshotUploaderGUI:
         # Schedule next check
         self.root.after(100, self.check_queue)
     
-    def pil_to_tk(self, pil_image: Image.Image):
-        """Convert PIL image to tkinter PhotoImage."""
-        from PIL import ImageTk
-        return ImageTk.PhotoImage(pil_image)
-    
     def add_screenshot_to_list(self, record: ScreenshotRecord):
         """Add a screenshot to the GUI list."""
-        # Create frame for this item
-        item_frame = ttk.Frame(self.scrollable_frame, padding="10")
+        # Idempotent: a survivor rebuilt by _delete_all_done may still
+        # have its 'uploaded' message queued, and creating the named row
+        # frame twice would raise TclError and kill the queue pump
+        if record.filename in self._row_widgets:
+            return
+
+        # Create frame for this item. The deterministic Tk name makes the
+        # row addressable via nametowidget without any child scan, and
+        # identifies it in Tk debugging output
+        safe_name = record.filename.replace('.', '_').lower()
+        item_frame = ttk.Frame(self.scrollable_frame, padding="10",
+                               name=f"row_{safe_name}")
         item_frame.pack(fill=tk.X, pady=(0, 2))
+
+        # Index for O(1) lookup when this row is deleted
+        self._row_widgets[record.filename] = item_frame
         
-        # Store reference
-        item_frame.record = record
-        
-        # Thumbnail
-        if record.thumbnail:
-            tk_thumb = self.pil_to_tk(record.thumbnail)
+        # Thumbnail - PPM bytes load in one bulk copy, no ImageTk round trip
+        if record.thumbnail_ppm:
+            tk_thumb = tk.PhotoImage(data=record.thumbnail_ppm)
             self.thumbnail_cache[record.filename] = tk_thumb  # Keep reference
             thumb_label = ttk.Label(item_frame, image=tk_thumb)
             thumb_label.pack(side=tk.LEFT, padx=(0, 15))
@@ -604,7 +992,7 @@ class ScreenshotUploaderGUI:
         copy_path_btn = ttk.Button(
             buttons_frame,
             text="Copy Path",
-            command=lambda r=record: self.copy_single_path(r)
+            command=partial(self.copy_single_path, record)
         )
         copy_path_btn.pack(side=tk.TOP, pady=(0, 5))
         
@@ -612,7 +1000,7 @@ class ScreenshotUploaderGUI:
         copy_b64_btn = ttk.Button(
             buttons_frame,
             text="Copy Base64",
-            command=lambda r=record: self.copy_base64(r)
+            command=partial(self.copy_base64, record)
         )
         copy_b64_btn.pack(side=tk.TOP, pady=(0, 5))
         
@@ -620,33 +1008,25 @@ class ScreenshotUploaderGUI:
         copy_image_btn = ttk.Button(
             buttons_frame,
             text="Copy Image",
-            command=lambda r=record: self.copy_image_to_clipboard(r)
+            command=partial(self.copy_image_to_clipboard, record)
         )
         copy_image_btn.pack(side=tk.TOP)
         
         # Separator
-        ttk.Separator(self.scrollable_frame, orient='horizontal').pack(fill=tk.X, pady=(2, 0))
+        separator = ttk.Separator(self.scrollable_frame, orient='horizontal',
+                                  name=f"sep_{safe_name}")
+        separator.pack(fill=tk.X, pady=(2, 0))
+        self._row_separators[record.filename] = separator
         
         # Update status
         if self.uploader._copy_path_to_clipboard:
-            self.status_label.config(
-                text="Path copied to clipboard! ✓",
-                foreground="green"
-            )
+            self._set_status("Path copied to clipboard! ✓", "green", revert_ms=2000)
         else:
-            self.status_label.config(
-                text=f"Uploaded: {record.filename}",
-                foreground="green"
-            )
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Monitoring clipboard...",
-            foreground="gray"
-        ))
+            self._set_status(f"Uploaded: {record.filename}", "green", revert_ms=2000)
         
         # Update stats
-        count = len(self.uploader.upload_history)
-        self.stats_label.config(text=f"Uploaded: {count} screenshot{'s' if count != 1 else ''}")
-        
+        self._update_stats(len(self.uploader.upload_history))
+
         # Scroll to top
         self.canvas.yview_moveto(0)
     
@@ -657,138 +1037,107 @@ class ScreenshotUploaderGUI:
             path = f'"{path}"'
         pyperclip.copy(path)
         
-        self.status_label.config(
-            text=f"Path copied: {record.filename} ✓",
-            foreground="green"
-        )
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Monitoring clipboard...",
-            foreground="gray"
-        ))
+        self._set_status(f"Path copied: {record.filename} ✓", "green", revert_ms=2000)
     
     def copy_base64(self, record: ScreenshotRecord):
         """Copy screenshot as base64 to clipboard."""
         try:
-            # Download the file from server temporarily
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-                local_path = tmp_file.name
-            
-            try:
-                # Download from server
-                self.uploader.sftp_client.get(record.remote_path, local_path)
-                
-                # Convert to base64
-                import base64
-                with open(local_path, 'rb') as f:
-                    image_data = f.read()
-                    base64_string = base64.b64encode(image_data).decode('utf-8')
-                
-                # Copy to clipboard
-                pyperclip.copy(base64_string)
-                
-                # Show size
-                size_kb = len(base64_string) / 1024
-                self.status_label.config(
-                    text=f"Base64 copied: {record.filename} ({size_kb:.1f} KB) ✓",
-                    foreground="green"
-                )
-                self.root.after(3000, lambda: self.status_label.config(
-                    text="Monitoring clipboard...",
-                    foreground="gray"
-                ))
-                
-            finally:
-                # Cleanup
-                if os.path.exists(local_path):
-                    os.unlink(local_path)
-                    
+            # Stream straight from the server into memory; prefetch fires
+            # the read requests in parallel so SFTP's small block size
+            # doesn't serialize them. No temp file, no extra disk pass.
+            import base64
+            if record.local_bytes is not None:
+                # We uploaded these bytes; no need to fetch them back
+                image_data = record.local_bytes
+            else:
+                image_data = self.uploader.fetch_remote_bytes(record.remote_path)
+            base64_string = base64.b64encode(image_data).decode('ascii')
+
+            # Copy to clipboard
+            pyperclip.copy(base64_string)
+
+            # Show size
+            size_kb = len(base64_string) / 1024
+            self._set_status(
+                f"Base64 copied: {record.filename} ({size_kb:.1f} KB) ✓",
+                "green", revert_ms=3000
+            )
+
         except Exception as e:
-            self.status_label.config(text=f"Base64 copy failed: {e}", foreground="red")
-            self.root.after(3000, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
+            self._set_status(f"Base64 copy failed: {e}", "red", revert_ms=3000)
     
     def copy_image_to_clipboard(self, record: ScreenshotRecord):
         """Copy the actual image to clipboard so it can be pasted into applications."""
         try:
-            # Download the file from server temporarily
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-                local_path = tmp_file.name
-            
-            try:
-                # Download from server
-                self.uploader.sftp_client.get(record.remote_path, local_path)
-                
-                # Open image
-                from PIL import Image
-                image = Image.open(local_path)
-                
-                # Copy to clipboard using Windows-specific method
-                # This allows pasting directly into web apps like Claude
-                import io
-                
-                # Convert to DIB format (Device Independent Bitmap) for clipboard
-                output = io.BytesIO()
-                image.convert("RGB").save(output, "BMP")
-                data = output.getvalue()[14:]  # Remove BMP header to get DIB
-                output.close()
-                
-                # Windows clipboard API
-                import ctypes
-                
-                # Allocate global memory
-                GHND = 0x0042
-                CF_DIB = 8
-                
-                # Get handle to global memory
-                handle = ctypes.windll.kernel32.GlobalAlloc(GHND, len(data))
-                locked_data = ctypes.windll.kernel32.GlobalLock(handle)
-                
-                # Copy data
-                ctypes.memmove(locked_data, data, len(data))
-                ctypes.windll.kernel32.GlobalUnlock(handle)
-                
-                # Open clipboard and set data
-                if ctypes.windll.user32.OpenClipboard(0):
-                    ctypes.windll.user32.EmptyClipboard()
-                    ctypes.windll.user32.SetClipboardData(CF_DIB, handle)
-                    ctypes.windll.user32.CloseClipboard()
-                
-                self.status_label.config(
-                    text=f"Image copied: {record.filename} - Ready to paste! ✓",
-                    foreground="green"
-                )
-                self.root.after(3000, lambda: self.status_label.config(
-                    text="Monitoring clipboard...",
-                    foreground="gray"
-                ))
-                
-            finally:
-                # Cleanup
-                if os.path.exists(local_path):
-                    os.unlink(local_path)
-                    
+            if record.local_bytes is not None:
+                # We still hold the uploaded JPEG; no server round trip
+                image_data = record.local_bytes
+            else:
+                image_data = self.uploader.fetch_remote_bytes(record.remote_path)
+
+            image = Image.open(io.BytesIO(image_data))
+
+            # Build the clipboard DIB directly: BITMAPINFOHEADER plus
+            # padded bottom-up BGR rows straight from PIL's raw encoder.
+            # No BMP encode, no header-slicing copy of the whole payload.
+            # This allows pasting directly into web apps like Claude
+            import ctypes
+            import struct
+
+            width, height = image.size
+            stride = (width * 3 + 3) & ~3  # DIB rows are DWORD-aligned
+            pixels = image.convert('RGB').tobytes('raw', 'BGR', stride, -1)
+            header = struct.pack(
+                '<IiiHHIIiiII',
+                40, width, height, 1, 24, 0, len(pixels), 3780, 3780, 0, 0
+            )
+
+            # Windows clipboard API
+            kernel32 = ctypes.windll.kernel32
+            user32 = ctypes.windll.user32
+            # Full-width pointers; the c_int defaults truncate on Win64
+            kernel32.GlobalAlloc.restype = ctypes.c_void_p
+            kernel32.GlobalLock.restype = ctypes.c_void_p
+            kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+            kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+            user32.SetClipboardData.restype = ctypes.c_void_p
+            user32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
+
+            GHND = 0x0042
+            CF_DIB = 8
+
+            handle = kernel32.GlobalAlloc(GHND, len(header) + len(pixels))
+            locked_data = kernel32.GlobalLock(handle)
+            ctypes.memmove(locked_data, header, len(header))
+            ctypes.memmove(locked_data + len(header), pixels, len(pixels))
+            kernel32.GlobalUnlock(handle)
+
+            # Open clipboard and set data
+            if user32.OpenClipboard(0):
+                user32.EmptyClipboard()
+                user32.SetClipboardData(CF_DIB, handle)
+                user32.CloseClipboard()
+
+            self._set_status(
+                f"Image copied: {record.filename} - Ready to paste! ✓",
+                "green", revert_ms=3000
+            )
+
         except Exception as e:
-            self.status_label.config(text=f"Image copy failed: {e}", foreground="red")
-            self.root.after(3000, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
+            self._set_status(f"Image copy failed: {e}", "red", revert_ms=3000)
 
     def copy_all_paths(self):
         """Copy all screenshot paths to clipboard, quoted if they contain spaces."""
         if not self.uploader.upload_history:
-            self.status_label.config(text="No screenshots to copy", foreground="orange")
-            self.root.after(1500, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
+            self._set_status("No screenshots to copy", "orange", revert_ms=1500)
             return
         
-        # Format paths with quotes if they contain spaces
+        # Format paths with quotes if they contain spaces (newest first,
+        # matching the on-screen order)
+        with self.uploader._history_lock:
+            records = list(reversed(self.uploader.upload_history.values()))
         formatted_paths = []
-        for record in self.uploader.upload_history:
+        for record in records:
             path = record.remote_path
             if ' ' in path:
                 formatted_paths.append(f'"{path}"')
@@ -803,14 +1152,10 @@ class ScreenshotUploaderGUI:
         
         # Update status
         count = len(self.uploader.upload_history)
-        self.status_label.config(
-            text=f"Copied {count} path{'s' if count != 1 else ''} to clipboard! ✓",
-            foreground="green"
+        self._set_status(
+            f"Copied {count} path{'s' if count != 1 else ''} to clipboard! ✓",
+            "green", revert_ms=2000
         )
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Monitoring clipboard...",
-            foreground="gray"
-        ))
         
         self.uploader.notify(
             "Paths Copied",
@@ -820,122 +1165,140 @@ class ScreenshotUploaderGUI:
     
     def delete_last_screenshot(self):
         """Delete the most recently uploaded screenshot with animation."""
+        if self._bulk_deleting:
+            return
         if not self.uploader.upload_history:
-            self.status_label.config(text="No screenshots to delete", foreground="orange")
-            self.root.after(1500, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
+            self._set_status("No screenshots to delete", "orange", revert_ms=1500)
             return
         
-        # Get last uploaded (first in list since we insert at beginning)
-        record = self.uploader.upload_history[0]
-        
-        # Find the frame for this record
-        for widget in self.scrollable_frame.winfo_children():
-            if isinstance(widget, ttk.Frame) and hasattr(widget, 'record'):
-                if widget.record.filename == record.filename:
-                    self.animate_delete(widget, record)
-                    break
+        # Get last uploaded (the most recently inserted entry)
+        with self.uploader._history_lock:
+            record = next(reversed(self.uploader.upload_history.values()))
+
+        widget = self._row_widgets.get(record.filename)
+        if widget is not None:
+            self.animate_delete(widget, record)
     
     def animate_delete(self, widget, record):
-        """Animate the deletion of a screenshot row."""
-        # Flash red
+        """Flash the row red once, then complete the deletion."""
         widget.configure(style='Red.TFrame')
-        self.root.after(100, lambda: self.animate_delete_step2(widget, record))
-    
-    def animate_delete_step2(self, widget, record):
-        """Step 2 of delete animation."""
+        # Positional after() args instead of a lambda - no closure for
+        # Tcl to retain, and one timer hop instead of three
+        self.root.after(150, self._finish_delete, widget, record)
+
+    def _finish_delete(self, widget, record):
+        """Reset the flash style and complete the deletion."""
         widget.configure(style='TFrame')
-        self.root.after(100, lambda: self.animate_delete_step3(widget, record))
-    
-    def animate_delete_step3(self, widget, record):
-        """Step 3 of delete animation - complete deletion."""
-        # Complete the deletion
-        self.complete_delete(widget, record)
+        # Let Tk coalesce the style reset with the teardown in a single
+        # idle pass instead of syncing each configure separately
+        self.root.after_idle(self.complete_delete, widget, record)
     
     def complete_delete(self, widget, record):
         """Complete the deletion after animation."""
         # Delete from server
         if self.uploader.delete_screenshot(record):
-            # Remove from history
-            self.uploader.upload_history.remove(record)
-            
-            # Destroy widget and its separator
+            # Remove from history - O(1) pop instead of a list scan
+            with self.uploader._history_lock:
+                self.uploader.upload_history.pop(record.filename, None)
+
+            # Destroy widget and its separator via the row index
+            self._row_widgets.pop(record.filename, None)
             widget.destroy()
-            
-            # Find and destroy the separator after this widget
-            children = self.scrollable_frame.winfo_children()
-            for i, child in enumerate(children):
-                if isinstance(child, ttk.Separator):
-                    child.destroy()
-                    break
-            
+            separator = self._row_separators.pop(record.filename, None)
+            if separator is not None:
+                separator.destroy()
+
+            # Delete the thumbnail from Tcl's image registry explicitly;
+            # destroying the row's label doesn't release the image itself
+            tk_thumb = self.thumbnail_cache.pop(record.filename, None)
+            if tk_thumb is not None:
+                self.root.tk.call('image', 'delete', str(tk_thumb))
+
             # Update stats
-            count = len(self.uploader.upload_history)
-            self.stats_label.config(text=f"Uploaded: {count} screenshot{'s' if count != 1 else ''}")
-            self.status_label.config(text=f"Deleted: {record.filename}", foreground="blue")
-            self.root.after(1500, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
-            
+            self._update_stats(len(self.uploader.upload_history))
+            self._set_status(f"Deleted: {record.filename}", "blue", revert_ms=1500)
+
             self.uploader.notify(
                 "Screenshot Deleted",
                 record.filename,
                 success=True
             )
         else:
-            self.status_label.config(text="Delete failed", foreground="red")
-            self.root.after(2000, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
+            self._set_status("Delete failed", "red", revert_ms=2000)
     
     def delete_all_screenshots(self):
         """Delete all uploaded screenshots."""
+        if self._bulk_deleting:
+            return
         if not self.uploader.upload_history:
-            self.status_label.config(text="No screenshots to delete", foreground="orange")
-            self.root.after(1500, lambda: self.status_label.config(
-                text="Monitoring clipboard...",
-                foreground="gray"
-            ))
+            self._set_status("No screenshots to delete", "orange", revert_ms=1500)
             return
-        
+
         count = len(self.uploader.upload_history)
-        self.status_label.config(text=f"Deleting all {count} screenshots...", foreground="orange")
-        self.root.update()
-        
-        # Delete all records
-        deleted = 0
-        failed = 0
-        
-        # Work with a copy since we'll be modifying the list
-        records_to_delete = self.uploader.upload_history.copy()
-        
-        for record in records_to_delete:
-            if self.uploader.delete_screenshot(record):
-                deleted += 1
-            else:
-                failed += 1
-        
-        # Clear the history list
-        self.uploader.upload_history.clear()
-        
-        # Clear the GUI
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Clear thumbnail cache
+        self._set_status(f"Deleting all {count} screenshots...", "orange")
+
+        # Snapshot and detach under the lock so uploads landing during
+        # the bulk delete aren't silently dropped from tracking
+        with self.uploader._history_lock:
+            records_to_delete = list(self.uploader.upload_history.values())
+
+        # Network work happens off the Tk thread so the GUI keeps
+        # painting; completion is posted back via after(0, ...)
+        self._bulk_deleting = True
+        threading.Thread(
+            target=self._delete_all_worker,
+            args=(records_to_delete,),
+            daemon=True
+        ).start()
+
+    def _delete_all_worker(self, records_to_delete):
+        """Run the remote deletes and post the result back to Tk."""
+        # One rm round trip for the whole batch; only if that fails, fan
+        # out per-record deletes over the pooled SFTP channels
+        if self.uploader.delete_many(records_to_delete):
+            deleted = len(records_to_delete)
+            failed = 0
+        else:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(self.uploader.delete_screenshot,
+                                            records_to_delete))
+            deleted = sum(results)
+            failed = len(results) - deleted
+        self.root.after(0, self._delete_all_done, records_to_delete, deleted, failed)
+
+    def _delete_all_done(self, records_to_delete, deleted, failed):
+        """Tk-thread completion for delete-all: clear the list and report."""
+        self._bulk_deleting = False
+
+        # Drop exactly the snapshotted records; an upload that landed
+        # while the worker was deleting stays tracked (its remote file
+        # was never part of the batch)
+        with self.uploader._history_lock:
+            for record in records_to_delete:
+                self.uploader.upload_history.pop(record.filename, None)
+            survivors = list(self.uploader.upload_history.values())
+
+        # Clear the GUI: one container destroy instead of a Tcl round
+        # trip per row and separator
+        self.scrollable_frame.destroy()
+        self._create_scrollable_frame()
+
+        # Clear thumbnail cache and row indexes
         self.thumbnail_cache.clear()
-        
+        self._row_widgets.clear()
+        self._row_separators.clear()
+
+        # Rebuild rows for anything that survived the snapshot
+        for record in survivors:
+            self.add_screenshot_to_list(record)
+
         # Update stats
-        self.stats_label.config(text="Uploaded: 0 screenshots")
-        
+        self._update_stats(len(survivors))
+
         if failed == 0:
-            self.status_label.config(
-                text=f"Deleted all {deleted} screenshot{'s' if deleted != 1 else ''}",
-                foreground="blue"
+            self._set_status(
+                f"Deleted all {deleted} screenshot{'s' if deleted != 1 else ''}",
+                "blue", revert_ms=2000
             )
             self.uploader.notify(
                 "All Screenshots Deleted",
@@ -943,19 +1306,11 @@ class ScreenshotUploaderGUI:
                 success=True
             )
         else:
-            self.status_label.config(
-                text=f"Deleted {deleted}, failed {failed}",
-                foreground="orange"
-            )
-        
-        self.root.after(2000, lambda: self.status_label.config(
-            text="Monitoring clipboard...",
-            foreground="gray"
-        ))
+            self._set_status(f"Deleted {deleted}, failed {failed}", "orange",
+                             revert_ms=2000)
     
     def quit_app(self):
-        """Quit the application."""
-        self.uploader.stop()
+        """Quit the application; main()'s finally does the teardown once."""
         self.root.quit()
         self.root.destroy()
     
@@ -972,13 +1327,22 @@ def main():
         print("Please ensure your SSH key is at ~/.ssh/hetzner_key")
         sys.exit(1)
     
-    # Get passphrase securely
-    print("Enter SSH key passphrase (input hidden): ", end='', flush=True)
-    passphrase = getpass.getpass('')
-    
-    if not passphrase:
-        print("Error: Passphrase is required")
-        sys.exit(1)
+    # Get passphrase: the OS keyring first, an interactive prompt only on
+    # the first run (or when no keyring backend is available)
+    keyring_account = f"{REMOTE_USER}@{REMOTE_HOST}"
+    try:
+        passphrase = keyring.get_password(KEYRING_SERVICE, keyring_account)
+    except Exception:
+        passphrase = None
+    from_prompt = passphrase is None
+
+    if from_prompt:
+        print("Enter SSH key passphrase (input hidden): ", end='', flush=True)
+        passphrase = getpass.getpass('')
+
+        if not passphrase:
+            print("Error: Passphrase is required")
+            sys.exit(1)
     
     # Create queue for GUI communication
     gui_queue = queue.Queue()
@@ -992,11 +1356,18 @@ def main():
         
         # Connect to server
         uploader.connect_ssh(passphrase)
-        
-        # Clear passphrase from memory
-        passphrase = '0' * len(passphrase)
+
+        # Remember a freshly typed passphrase only once it actually
+        # unlocked the key, so a typo never gets persisted
+        if from_prompt:
+            try:
+                keyring.set_password(KEYRING_SERVICE, keyring_account, passphrase)
+                print("Passphrase stored in the OS keyring for next launch")
+            except Exception:
+                pass
+
+        # Drop our reference; only connect_ssh ever saw the string
         del passphrase
-        gc.collect()
         
         # Start monitoring in background thread
         monitor_thread = threading.Thread(target=uploader.run, daemon=True)
@@ -1007,6 +1378,14 @@ def main():
         gui.run()
         
     except Exception as e:
+        if not from_prompt:
+            # Don't let a stale keyring entry wedge every future launch;
+            # worst case a transient failure costs one re-prompt
+            try:
+                keyring.delete_password(KEYRING_SERVICE, keyring_account)
+                print("Cleared the stored passphrase - you'll be prompted next launch")
+            except Exception:
+                pass
         print(f"Error: {e}")
         sys.exit(1)
     finally: